@@ -1,4 +1,60 @@
+import asyncio
+import importlib.metadata
+import sys
+
+import pytest
+import pytest_asyncio
+
 from hamilton import telemetry
+from hamilton.experimental import h_async
+
+from .resources import simple_async_module
 
 # disable telemetry for all tests!
 telemetry.disable_telemetry()
+
+_PYTEST_ASYNCIO_VERSION = tuple(
+    int(part) for part in importlib.metadata.version("pytest-asyncio").split(".")[:2]
+)
+
+
+# the loop factories hook only exists in pytest-asyncio>=1.4.0 (python 3.10+) -- pytest rejects unknown
+# hooks, so on older versions we skip it and just run on the default event loop.
+if _PYTEST_ASYNCIO_VERSION >= (1, 4):
+
+    def pytest_asyncio_loop_factories(config, item):
+        """Runs every async test on the default asyncio event loop, and again on uvloop where it is
+        available -- it is an optional, drop-in replacement users may opt into."""
+        factories = {"asyncio": asyncio.new_event_loop}
+        if sys.platform != "win32":
+            try:
+                import uvloop
+
+                factories["uvloop"] = uvloop.new_event_loop
+            except ImportError:
+                pass
+        return factories
+
+
+@pytest.fixture(scope="session")
+def async_driver():
+    """Driver over simple_async_module, built once and shared by the end-to-end tests (across every
+    loop factory). This is safe as the graph is immutable once built, and all execution state (tasks,
+    memoized results) is created per-call on the event loop of whichever test awaits it.
+
+    Tests that need a different config, result builder, or check constructor telemetry build their own.
+    """
+    return h_async.AsyncDriver({}, simple_async_module)
+
+
+@pytest_asyncio.fixture
+async def eager_task_factory():
+    """Installs the eager task factory (python 3.12+) on the running loop, so tests that use this
+    exercise the fast-path where tasks complete without a trip through the event loop."""
+    if not hasattr(asyncio, "eager_task_factory"):
+        pytest.skip("asyncio.eager_task_factory requires python 3.12+")
+    loop = asyncio.get_running_loop()
+    original_factory = loop.get_task_factory()
+    loop.set_task_factory(asyncio.eager_task_factory)
+    yield
+    loop.set_task_factory(original_factory)
@@ -1,17 +1,39 @@
 import asyncio
 from unittest import mock
 
-import pandas as pd
+import numpy as np
 import pytest
 
-from hamilton import base
+from hamilton import base, telemetry
 from hamilton.experimental import h_async
 
 from .resources import simple_async_module
 
+_EXPECTED_WITHOUT_AB = {
+    "another_async_func": 8,
+    "async_func_with_param": 4,
+    "external_input": 1,
+    "non_async_func_with_decorator": {"result_1": 9, "result_2": 5},
+    "result_1": 9,
+    "result_2": 5,
+    "result_3": 1,
+    "result_4": 2,
+    "return_dict": {"result_3": 1, "result_4": 2},
+    "simple_async_func": 2,
+    "simple_non_async_func": 7,
+}
+
+
+def _assert_expected(result: dict):
+    """Checks the end-to-end result, comparing the extracted columns without a pandas round-trip."""
+    np.testing.assert_array_equal(result.pop("a").values, [1, 2, 3])
+    np.testing.assert_array_equal(result.pop("b").values, [4, 5, 6])
+    assert result == _EXPECTED_WITHOUT_AB
+
 
 async def async_identity(n: int) -> int:
-    await asyncio.sleep(0.01)
+    # yield to the event loop once -- we only care that this suspends, not for how long
+    await asyncio.sleep(0)
     return n
 
 
@@ -19,14 +41,74 @@ async def async_identity(n: int) -> int:
 async def test_await_dict_of_coroutines():
     tasks = {n: async_identity(n) for n in range(0, 10)}
     results = await h_async.await_dict_of_tasks(tasks)
-    assert results == {n: await async_identity(n) for n in range(0, 10)}
+    assert results == {n: n for n in range(0, 10)}
 
 
 @pytest.mark.asyncio
 async def test_await_dict_of_tasks():
     tasks = {n: asyncio.create_task(async_identity(n)) for n in range(0, 10)}
     results = await h_async.await_dict_of_tasks(tasks)
-    assert results == {n: await async_identity(n) for n in range(0, 10)}
+    assert results == {n: n for n in range(0, 10)}
+
+
+@pytest.mark.asyncio
+async def test_await_dict_of_coroutines_eager(eager_task_factory):
+    async def non_blocking_identity(n: int) -> int:
+        return n
+
+    tasks = {n: non_blocking_identity(n) for n in range(0, 10)}
+    with mock.patch("asyncio.gather") as gather:
+        results = await h_async.await_dict_of_tasks(tasks)
+    # everything completed eagerly, so we never had to go through the event loop
+    assert not gather.called
+    assert results == {n: n for n in range(0, 10)}
+
+
+@pytest.mark.asyncio
+async def test_await_dict_of_tasks_does_not_rewrap_tasks():
+    tasks = {n: asyncio.create_task(async_identity(n)) for n in range(0, 10)}
+    with mock.patch("asyncio.ensure_future") as ensure_future:
+        results = await h_async.await_dict_of_tasks(tasks)
+    assert not ensure_future.called
+    assert results == {n: n for n in range(0, 10)}
+
+
+@pytest.mark.asyncio
+async def test_await_dict_of_tasks_cancellation_propagates():
+    tasks = {n: asyncio.create_task(asyncio.sleep(0.2)) for n in range(0, 3)}
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(h_async.await_dict_of_tasks(tasks), 0.01)
+    await asyncio.sleep(0)  # let the cancellation reach the tasks
+    assert all(task.cancelled() for task in tasks.values())
+
+
+@pytest.mark.asyncio
+async def test_await_dict_of_tasks_already_failed_raises_immediately():
+    failed = asyncio.get_running_loop().create_future()
+    failed.set_exception(ValueError("fail"))
+    slow = asyncio.create_task(asyncio.sleep(0.5))
+    with pytest.raises(ValueError):
+        await asyncio.wait_for(h_async.await_dict_of_tasks({"a": failed, "b": slow}), 0.1)
+    slow.cancel()
+
+
+@pytest.mark.asyncio
+async def test_await_dict_of_tasks_raises():
+    async def fail():
+        raise ValueError("fail")
+
+    with pytest.raises(ValueError):
+        await h_async.await_dict_of_tasks({"a": async_identity(1), "b": fail()})
+
+
+@pytest.mark.asyncio
+async def test_await_dict_of_tasks_already_done():
+    loop = asyncio.get_running_loop()
+    futures = {n: loop.create_future() for n in range(0, 10)}
+    for n, future in futures.items():
+        future.set_result(n)
+    results = await h_async.await_dict_of_tasks(futures)
+    assert results == {n: n for n in range(0, 10)}
 
 
 # The following are not parameterized as we need to use the event loop -- fixtures will complicate this
@@ -35,6 +117,16 @@ async def test_process_value_raw():
     assert await h_async.process_value(1) == 1
 
 
+@pytest.mark.asyncio
+async def test_process_value_raw_already_done():
+    assert h_async._process_value(1).done()
+
+
+@pytest.mark.asyncio
+async def test_process_value_task_from_coroutine():
+    assert await asyncio.create_task(h_async.process_value(1)) == 1
+
+
 @pytest.mark.asyncio
 async def test_process_value_coroutine():
     assert await h_async.process_value(async_identity(1)) == 1
@@ -46,27 +138,29 @@ async def test_process_value_task():
 
 
 @pytest.mark.asyncio
-async def test_driver_end_to_end():
-    dr = h_async.AsyncDriver({}, simple_async_module)
-    all_vars = [var.name for var in dr.list_available_variables() if var.name != "return_df"]
+async def test_driver_end_to_end(async_driver):
+    dr = async_driver
+    all_vars = dr.all_vars_except({"return_df"})
     result = await dr.raw_execute(final_vars=all_vars, inputs={"external_input": 1})
-    result["a"] = result["a"].to_dict()  # convert to dict for comparison
-    result["b"] = result["b"].to_dict()  # convert to dict for comparison
-    assert result == {
-        "a": pd.Series([1, 2, 3]).to_dict(),
-        "another_async_func": 8,
-        "async_func_with_param": 4,
-        "b": pd.Series([4, 5, 6]).to_dict(),
-        "external_input": 1,
-        "non_async_func_with_decorator": {"result_1": 9, "result_2": 5},
-        "result_1": 9,
-        "result_2": 5,
-        "result_3": 1,
-        "result_4": 2,
-        "return_dict": {"result_3": 1, "result_4": 2},
-        "simple_async_func": 2,
-        "simple_non_async_func": 7,
-    }
+    _assert_expected(result)
+
+
+@pytest.mark.asyncio
+async def test_driver_end_to_end_other_inputs(async_driver):
+    # the shared driver holds no per-run state, so different inputs give different results
+    dr = async_driver
+    result = await dr.raw_execute(
+        final_vars=["another_async_func", "result_1"], inputs={"external_input": 2}
+    )
+    assert result == {"another_async_func": 11, "result_1": 12}
+
+
+@pytest.mark.asyncio
+async def test_driver_end_to_end_eager(async_driver, eager_task_factory):
+    dr = async_driver
+    all_vars = dr.all_vars_except({"return_df"})
+    result = await dr.raw_execute(final_vars=all_vars, inputs={"external_input": 1})
+    _assert_expected(result)
 
 
 @pytest.mark.asyncio
@@ -74,31 +168,24 @@ async def test_driver_end_to_end():
 @mock.patch("hamilton.telemetry.g_telemetry_enabled", True)
 async def test_driver_end_to_end_telemetry(send_event_json):
     dr = h_async.AsyncDriver({}, simple_async_module, result_builder=base.DictResult())
-    with mock.patch("hamilton.telemetry.g_telemetry_enabled", False):
-        # don't count this telemetry tracking invocation
-        all_vars = [var.name for var in dr.list_available_variables() if var.name != "return_df"]
+    # don't count this telemetry tracking invocation
+    telemetry.g_telemetry_enabled = False
+    try:
+        all_vars = dr.all_vars_except({"return_df"})
+    finally:
+        telemetry.g_telemetry_enabled = True
     result = await dr.execute(final_vars=all_vars, inputs={"external_input": 1})
-    result["a"] = result["a"].to_dict()
-    result["b"] = result["b"].to_dict()
-    assert result == {
-        "a": pd.Series([1, 2, 3]).to_dict(),
-        "another_async_func": 8,
-        "async_func_with_param": 4,
-        "b": pd.Series([4, 5, 6]).to_dict(),
-        "external_input": 1,
-        "non_async_func_with_decorator": {"result_1": 9, "result_2": 5},
-        "result_1": 9,
-        "result_2": 5,
-        "result_3": 1,
-        "result_4": 2,
-        "return_dict": {"result_3": 1, "result_4": 2},
-        "simple_async_func": 2,
-        "simple_non_async_func": 7,
-    }
-    # to ensure the last telemetry invocation finishes executing
-    # get all tasks -- and the current task, and await all others.
-    tasks = asyncio.all_tasks()
-    current_task = asyncio.current_task()
-    await asyncio.gather(*[t for t in tasks if t != current_task])
+    _assert_expected(result)
+    # to ensure the telemetry invocations finish executing
+    await dr.wait_for_telemetry()
     assert send_event_json.called
     assert len(send_event_json.call_args_list) == 2
+
+
+@pytest.mark.asyncio
+@mock.patch("hamilton.telemetry.send_event_json")
+@mock.patch("hamilton.telemetry.g_telemetry_enabled", True)
+async def test_driver_constructor_telemetry_inline(send_event_json):
+    h_async.AsyncDriver({}, simple_async_module)
+    # sent on construction, without yielding to the event loop
+    assert len(send_event_json.call_args_list) == 1
@@ -119,6 +119,12 @@ class Driver(object):
         self.graph_modules = modules
         try:
             self.graph = graph.FunctionGraph(*modules, config=config, adapter=adapter)
+            # the graph does not change post-construction, so capture what variables are made of once
+            self._variable_fields = tuple(
+                (node_.name, node_.type, node_.tags, node_.user_defined)
+                for node_ in self.graph.get_nodes()
+            )
+            self._all_node_names = frozenset(name for name, *_ in self._variable_fields)
             self.adapter = adapter
         except Exception as e:
             error = telemetry.sanitize_error(*sys.exc_info())
@@ -390,10 +396,28 @@ class Driver(object):
         :return: list of available variables (i.e. outputs).
         """
         return [
-            Variable(node.name, node.type, node.tags, node.user_defined)
-            for node in self.graph.get_nodes()
+            Variable(name, type_, dict(tags), is_external_input)
+            for name, type_, tags, is_external_input in self._variable_fields
         ]
 
+    @capture_function_usage
+    def all_vars_except(self, exclude: Collection[str]) -> List[str]:
+        """Returns the names of all available variables, except the ones passed in.
+
+        This is a convenience for requesting (almost) everything in the DAG, e.g.
+        `dr.execute(dr.all_vars_except({"some_dataframe"}))`.
+
+        :param exclude: names of variables to leave out. Names not in the DAG are ignored.
+        :return: sorted list of variable names.
+        :raise ValueError: if `exclude` is a single string rather than a collection of names.
+        """
+        if isinstance(exclude, str):
+            raise ValueError(
+                "all_vars_except expects a collection of variable names, not a single string. "
+                f'Did you mean all_vars_except({{"{exclude}"}})?'
+            )
+        return sorted(self._all_node_names - frozenset(exclude))
+
     @capture_function_usage
     def display_all_functions(
         self, output_file_path: str, render_kwargs: dict = None, graphviz_kwargs: dict = None
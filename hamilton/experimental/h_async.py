@@ -3,22 +3,50 @@ import inspect
 import logging
 import sys
 import time
-import types
 import typing
 from types import ModuleType
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Set, Tuple
 
 from hamilton import base, driver, node, telemetry
 
 logger = logging.getLogger(__name__)
 
 
-async def await_dict_of_tasks(task_dict: Dict[str, types.CoroutineType]) -> Dict[str, Any]:
-    """Util to await a dictionary of tasks as asyncio.gather is kind of garbage"""
-    keys = sorted(task_dict.keys())
-    coroutines = [task_dict[key] for key in keys]
-    coroutines_gathered = await asyncio.gather(*coroutines)
-    return dict(zip(keys, coroutines_gathered))
+async def await_dict_of_tasks(task_dict: Dict[str, typing.Awaitable]) -> Dict[str, Any]:
+    """Util to await a dictionary of awaitables (futures, tasks, or coroutines), returning a dictionary of results.
+
+    If every value is already done (E.G. resolved values from `_process_value`, or tasks that completed
+    eagerly), the results are read directly without a trip through the event loop. Otherwise,
+    everything is awaited together with `asyncio.gather`.
+
+    :param task_dict: Dictionary of key -> awaitable.
+    :return: Dictionary of key -> result.
+    """
+    # parallel lists of keys/futures -- we only build a dict once, at the end.
+    items = sorted(task_dict.items(), key=lambda item: item[0])
+    keys = [key for key, _ in items]
+    # tasks/futures are used as-is, so we don't double-schedule them. Everything else goes through
+    # ensure_future, which honors the loop's task factory (E.G. asyncio.eager_task_factory in 3.12+),
+    # so anything that completes without blocking is already done by the time we get here.
+    futures = [
+        value if asyncio.isfuture(value) else asyncio.ensure_future(value) for _, value in items
+    ]
+    # anything already done skips the scheduler round-trip entirely. Failures go through gather,
+    # so every sibling exception is marked as retrieved.
+    if all(_is_done_without_error(future) for future in futures):
+        results = [future.result() for future in futures]
+    else:
+        results = await asyncio.gather(*futures)
+    return dict(zip(keys, results))
+
+
+def _is_done_without_error(future: asyncio.Future) -> bool:
+    """Whether a future has completed successfully, i.e. its result can be read without raising.
+
+    :param future: Future to check.
+    :return: True if it is done, not cancelled, and did not raise.
+    """
+    return future.done() and not future.cancelled() and future.exception() is None
 
 
 async def process_value(val: Any) -> Any:
@@ -33,6 +61,22 @@ async def process_value(val: Any) -> Any:
     return await val
 
 
+def _process_value(val: Any) -> asyncio.Future:
+    """Internal version of `process_value` that wraps the value in a future, rather than being a coroutine.
+    Already-resolved values get an already-completed future, so they do not pay for a trip through the
+    event loop (see `await_dict_of_tasks`). Must be called with a running event loop, and note that
+    awaitables are scheduled immediately.
+
+    :param val: Value to process.
+    :return: A future for the value (resolved if it is an awaitable, raw otherwise).
+    """
+    if not inspect.isawaitable(val):
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(val)
+        return future
+    return asyncio.ensure_future(val)
+
+
 class AsyncGraphAdapter(base.SimplePythonDataFrameGraphAdapter):
     """Graph adapter for use with the :class:`AsyncDriver` class."""
 
@@ -64,10 +108,10 @@ class AsyncGraphAdapter(base.SimplePythonDataFrameGraphAdapter):
         callabl = node.callable
 
         async def new_fn(fn=callabl, **fn_kwargs):
-            task_dict = {key: process_value(value) for key, value in fn_kwargs.items()}
+            task_dict = {key: _process_value(value) for key, value in fn_kwargs.items()}
             fn_kwargs = await await_dict_of_tasks(task_dict)
             if inspect.iscoroutinefunction(fn):
-                return await (fn(**fn_kwargs))
+                return await fn(**fn_kwargs)
             return fn(**fn_kwargs)
 
         coroutine = new_fn(**kwargs)
@@ -101,11 +145,41 @@ class AsyncDriver(driver.Driver):
         :param config: Config to build the graph
         :param modules: Modules to crawl for fns/graph nodes
         :param result_builder: Results mixin to compile the graph's final results. TBD whether this should be included in the long run.
+
+        Note: this runs on whichever event loop is running. For coroutine-heavy DAGs you can opt into
+        `uvloop <https://github.com/MagicStack/uvloop>`__ (not a dependency of hamilton) for cheaper
+        task scheduling, e.g. ``uvloop.install()`` or ``asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())``
+        before starting your event loop.
         """
+        # references to in-flight telemetry tasks -- the event loop only holds weak references.
+        # See wait_for_telemetry().
+        self._telemetry_tasks: Set[asyncio.Future] = set()
         super(AsyncDriver, self).__init__(
             config, *modules, adapter=AsyncGraphAdapter(result_builder=result_builder)
         )
 
+    def _track_telemetry_task(self, task: asyncio.Future):
+        """Holds onto a telemetry task until it is done.
+
+        :param task: the telemetry task to track.
+        """
+        self._telemetry_tasks.add(task)
+        task.add_done_callback(self._telemetry_tasks.discard)
+
+    async def wait_for_telemetry(self):
+        """Waits for any telemetry this driver still has in flight on the event loop.
+
+        Telemetry is captured in the background after `execute`, so you do not need to call this.
+        It is useful if you want to make sure it has gone out, E.G. before closing the event loop.
+
+        .. code-block:: python
+
+            df = await dr.execute([...], inputs=...)
+            await dr.wait_for_telemetry()
+
+        """
+        await asyncio.gather(*self._telemetry_tasks)
+
     async def raw_execute(
         self,
         final_vars: typing.List[str],
@@ -129,9 +203,7 @@ class AsyncDriver(driver.Driver):
                 "display_graph=True is not supported for the async graph adapter. "
                 "Instead you should be using visualize_execution."
             )
-        task_dict = {
-            key: asyncio.create_task(process_value(memoized_computation[key])) for key in final_vars
-        }
+        task_dict = {key: _process_value(memoized_computation[key]) for key in final_vars}
         return await await_dict_of_tasks(task_dict)
 
     async def execute(
@@ -180,7 +252,7 @@ class AsyncDriver(driver.Driver):
 
                 try:
                     # we don't have to await because we are running within the event loop.
-                    asyncio.create_task(make_coroutine())
+                    self._track_telemetry_task(asyncio.create_task(make_coroutine()))
                 except Exception as e:
                     if logger.isEnabledFor(logging.DEBUG):
                         logger.error(f"Encountered error submitting async telemetry:\n{e}")
@@ -206,13 +278,10 @@ class AsyncDriver(driver.Driver):
                 # check whether the event loop has been started yet or not
                 loop = asyncio.get_event_loop()
                 if loop.is_running():
-                    loop.run_in_executor(
-                        None,
-                        super(AsyncDriver, self).capture_constructor_telemetry,
-                        error,
-                        modules,
-                        config,
-                        adapter,
+                    # this is non-blocking -- it just builds the payload, sending happens on its own
+                    # thread. So we call it inline rather than paying for a hop to the executor.
+                    super(AsyncDriver, self).capture_constructor_telemetry(
+                        error, modules, config, adapter
                     )
                 else:
 
@@ -64,6 +64,29 @@ def test_driver_external_input():
     assert input_types["b"] is False
 
 
+def test_driver_list_available_variables_cached():
+    dr = Driver({}, tests.resources.tagging)
+    with mock.patch.object(dr.graph, "get_nodes", wraps=dr.graph.get_nodes) as get_nodes:
+        first = dr.list_available_variables()
+        # mutating what is returned should not affect later calls
+        first[0].name = "mutated"
+        first[0].tags["mutated"] = "mutated"
+        first.clear()
+        second = dr.list_available_variables()
+    assert get_nodes.call_count == 0
+    assert "mutated" not in {var.name for var in second}
+    assert all("mutated" not in var.tags for var in second)
+    assert {var.name for var in second} == set(dr.all_vars_except(set()))
+
+
+def test_driver_all_vars_except():
+    dr = Driver({}, tests.resources.very_simple_dag)
+    assert dr.all_vars_except(set()) == ["a", "b"]
+    assert dr.all_vars_except({"a", "not_in_dag"}) == ["b"]
+    with pytest.raises(ValueError):
+        dr.all_vars_except("a")
+
+
 @mock.patch("hamilton.telemetry.send_event_json")
 def test_capture_constructor_telemetry_disabled(send_event_json):
     """Tests that we don't do anything if telemetry is disabled."""